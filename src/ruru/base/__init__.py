@@ -1,5 +1,5 @@
 """Base module for argument matching functionality."""
 
-from ruru.base.matching import match_arg
+from ruru.base.matching import match_arg, match_arg_many, match_arg_one
 
-__all__ = ["match_arg"]
+__all__ = ["match_arg", "match_arg_many", "match_arg_one"]
@@ -4,24 +4,137 @@ This module provides Python equivalents of R's match.arg and pmatch functions.
 Inspired by the R package `base` (https://stat.ethz.ch/R-manual/R-devel/library/base/html/00Index.html).
 """
 
-from collections.abc import Iterable
-from functools import singledispatch
+import sys
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from operator import itemgetter
 from typing import Literal, overload
 
-from pydantic import validate_call
+
+@lru_cache(maxsize=256)
+def _prepare_choices(choices: tuple[str, ...]) -> tuple[str, ...]:
+    """Deduplicate a choices tuple, preserving first-seen order.
+
+    Cached so that repeated calls with the same choices (the typical usage,
+    where choices is a constant literal) skip the per-call deduplication.
+    The choices are interned so that comparisons against interned arguments
+    (string literals are interned by CPython) hit the pointer-equality fast
+    path in == and startswith.
+    """
+    return tuple(sys.intern(choice) for choice in dict.fromkeys(choices))
+
+
+@lru_cache(maxsize=256)
+def _sorted_index(table: tuple[str, ...]) -> tuple[tuple[str, ...], tuple[int, ...]]:
+    """Build the sorted prefix index for a table tuple.
+
+    Returns the sorted choices and their original indices as parallel tuples.
+    The sort is stable, so duplicated choices keep their original relative
+    order. Cached so repeated lookups against the same table reuse the index.
+    """
+    pairs = sorted(enumerate(table), key=itemgetter(1))
+    keys = tuple(choice for _, choice in pairs)
+    indices = tuple(index for index, _ in pairs)
+    return keys, indices
+
+
+@lru_cache(maxsize=256)
+def _exact_index(table: tuple[str, ...]) -> dict[str, int]:
+    """Map each choice in a table tuple to its first index.
+
+    Cached alongside the sorted index so that exact matches resolve with a
+    single hash lookup instead of a linear scan.
+    """
+    index: dict[str, int] = {}
+    for i, choice in enumerate(table):
+        index.setdefault(choice, i)
+    return index
+
+
+@lru_cache(maxsize=256)
+def _first_char_buckets(table: tuple[str, ...]) -> dict[str, tuple[str, ...]]:
+    """Group the choices in a table tuple by their first character.
+
+    Cached so that collecting partial matches only scans choices that share
+    a first character with the argument, instead of the whole table.
+    """
+    buckets: dict[str, list[str]] = {}
+    for choice in table:
+        if choice:
+            buckets.setdefault(choice[0], []).append(choice)
+    return {char: tuple(choices) for char, choices in buckets.items()}
+
+
+# Minimum table size before building a prefix trie is worthwhile; below this
+# the bisect over the sorted index is cheaper than the trie construction.
+_TRIE_THRESHOLD = 16
+
+# Shared between the single-argument entry points and _match_iterable so the
+# rejection reads identically regardless of the dispatch path taken
+_ITERABLE_INPUT_ERROR = (
+    "Iterable input is only allowed when several_ok=True. "
+    "Use several_ok=True or provide a single string argument."
+)
+
+
+class _TrieNode:
+    """Node of the compact prefix trie built for large choice tables."""
+
+    __slots__ = ("children", "leaf_index", "subtree_count", "terminal_index")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.terminal_index: int | None = None
+        self.subtree_count = 0
+        self.leaf_index: int | None = None
+
+
+@lru_cache(maxsize=256)
+def _prefix_trie(table: tuple[str, ...]) -> _TrieNode | None:
+    """Build a prefix trie for a table tuple, or None for small tables.
+
+    Each node tracks how many choices pass through it (subtree_count) and,
+    when exactly one does, that choice's index (leaf_index), so a walk over
+    the argument resolves unique/ambiguous prefixes in O(len(arg)).
+    """
+    if len(table) < _TRIE_THRESHOLD:
+        return None
+    root = _TrieNode()
+    for index, choice in enumerate(table):
+        node = root
+        node.subtree_count += 1
+        node.leaf_index = index if node.subtree_count == 1 else None
+        for char in choice:
+            node = node.children.setdefault(char, _TrieNode())
+            node.subtree_count += 1
+            node.leaf_index = index if node.subtree_count == 1 else None
+        node.terminal_index = index
+    return root
+
+
+def _trie_lookup(node: _TrieNode, x: str) -> int | None:
+    """Walk the prefix trie for x, mirroring pmatch's return convention."""
+    for char in x:
+        child = node.children.get(char)
+        if child is None:
+            return None
+        node = child
+    if node.subtree_count == 1:
+        return node.leaf_index
+    return -1  # Ambiguous
 
 
 @overload
 def match_arg(
-    arg: str | Iterable[str], choices: list[str], *, several_ok: Literal[False] = False
+    arg: str | Iterable[str], choices: Sequence[str], *, several_ok: Literal[False] = False
 ) -> str: ...
 @overload
 def match_arg(
-    arg: str | Iterable[str], choices: list[str], *, several_ok: Literal[True]
+    arg: str | Iterable[str], choices: Sequence[str], *, several_ok: Literal[True]
 ) -> list[str]: ...
-@validate_call
 def match_arg(
-    arg: str | Iterable[str], choices: list[str], *, several_ok: bool = False
+    arg: str | Iterable[str], choices: Sequence[str], *, several_ok: bool = False
 ) -> str | list[str]:
     """Matches the argument(s) against a list of candidate values with partial matching.
 
@@ -37,7 +150,7 @@ def match_arg(
 
     Args:
         arg: The argument string or iterable of strings to be matched against choices.
-        choices: List of valid choices to match against. Duplicates are removed.
+        choices: Valid choices to match against. Duplicates are removed.
         several_ok: If True, allows multiple matches and always returns list.
                    If False, requires unique match. For iterable input, raises error.
 
@@ -50,60 +163,132 @@ def match_arg(
     Raises:
         ValueError: If no match found, if ambiguous match when several_ok=False,
                    or if iterable input provided when several_ok=False.
+        TypeError: If arg is not a string or an iterable of strings.
     """
-    return _match_arg(arg, choices, several_ok=several_ok)
+    if not isinstance(arg, str | Iterable):
+        msg = f"arg must be a string or an iterable of strings, got {type(arg).__name__}."
+        raise TypeError(msg)
+    if several_ok:
+        return match_arg_many(arg, choices)
+    if not isinstance(arg, str):
+        # Iterable input requires several_ok=True; reuse the shared error path
+        return _match_iterable(arg, choices, several_ok=False)
+    return match_arg_one(arg, choices)
+
 
+def match_arg_one(arg: str, choices: Sequence[str]) -> str:
+    """Match a single string argument, returning the unique matched choice.
 
-@singledispatch
-def _match_arg(
-    arg: str | Iterable[str], choices: list[str], *, several_ok: bool = False
-) -> str | list[str]: ...
+    Specialized entry point equivalent to match_arg(arg, choices,
+    several_ok=False), without the keyword dispatch through the wrapper.
 
+    Args:
+        arg: The argument string to be matched against choices.
+        choices: Valid choices to match against. Duplicates are removed.
 
-@_match_arg.register(str)
-def _(arg: str, choices: list[str], *, several_ok: bool = False) -> str | list[str]:
-    """Internal implementation for string argument matching.
+    Returns:
+        The single matched string.
+
+    Raises:
+        ValueError: If no match found, if the match is ambiguous, or if arg
+            is an iterable rather than a single string.
+        TypeError: If arg is neither a string nor an iterable of strings.
+    """
+    if not isinstance(arg, str):
+        if not isinstance(arg, Iterable):
+            msg = f"arg must be a string or an iterable of strings, got {type(arg).__name__}."
+            raise TypeError(msg)
+        # Iterable input requires several_ok=True; ValueError (not TypeError)
+        # is the documented contract shared with match_arg
+        raise ValueError(_ITERABLE_INPUT_ERROR)  # noqa: TRY004
+    return _match_one(arg, _prepare_choices(tuple(choices)), several_ok=False)
+
+
+def match_arg_many(arg: str | Iterable[str], choices: Sequence[str]) -> list[str]:
+    """Match one or many arguments, always returning a list of matches.
+
+    Specialized entry point equivalent to match_arg(arg, choices,
+    several_ok=True), without the keyword dispatch through the wrapper.
+
+    Args:
+        arg: The argument string or iterable of strings to match.
+        choices: Valid choices to match against. Duplicates are removed.
+
+    Returns:
+        List containing all matched strings.
+
+    Raises:
+        ValueError: If any element cannot be matched.
+    """
+    if isinstance(arg, str):
+        return _match_one(arg, _prepare_choices(tuple(choices)), several_ok=True)
+    return _match_iterable(arg, choices, several_ok=True)
+
+
+@overload
+def _match_one(arg: str, choices: tuple[str, ...], *, several_ok: Literal[False]) -> str: ...
+@overload
+def _match_one(arg: str, choices: tuple[str, ...], *, several_ok: Literal[True]) -> list[str]: ...
+def _match_one(arg: str, choices: tuple[str, ...], *, several_ok: bool) -> str | list[str]:
+    """Match a single argument against an already-deduplicated choices tuple.
+
+    Low-level worker shared by the string and iterable branches, so batch
+    matching can loop over elements without re-deduplicating or re-dispatching
+    per element.
 
     Args:
         arg: The argument string to be matched against choices.
-        choices: List of valid choices to match against. Duplicates are removed.
+        choices: Deduplicated tuple of valid choices (from _prepare_choices).
         several_ok: If True, allows multiple matches and always returns list.
-                   If False, requires unique match and returns single string.
 
     Returns:
-        When several_ok=False: Single matched string.
-        When several_ok=True: List containing matched string(s).
-        For ambiguous matches with several_ok=True, returns all partial matches.
+        The matched string, or a list of matched strings when several_ok=True.
 
     Raises:
         ValueError: If no match found, or if ambiguous match when several_ok=False.
     """
-    # Ensure choices are unique
-    choices = list(dict.fromkeys(choices))
-
     # Use pmatch for partial matching
     match_idx = pmatch(arg, choices)
 
     if match_idx is None:
         # No match found
         available_choices = ", ".join(choices)
-        error_message = (
-            f"The provided argument '{arg}' is not valid. "
-            f"Available choices are: {available_choices}."
+        # Joining pre-tokenized parts avoids f-string formatting bytecode
+        error_message = "".join(  # noqa: FLY002
+            (
+                "The provided argument '",
+                arg,
+                "' is not valid. Available choices are: ",
+                available_choices,
+                ".",
+            )
         )
         raise ValueError(error_message)
     elif match_idx == -1:
-        # Ambiguous match
+        # Ambiguous match: only choices sharing arg's first character can match
+        bucket = _first_char_buckets(choices).get(arg[0], ())
+        # Checking the length first skips startswith on obviously-too-short choices
+        arg_length = len(arg)
         if several_ok:
             # Return all partial matches when several_ok=True
-            partial_matches = [choice for choice in choices if choice.startswith(arg)]
+            partial_matches = [
+                choice for choice in bucket if len(choice) >= arg_length and choice.startswith(arg)
+            ]
             return partial_matches
         else:
             # Error on ambiguous match when several_ok=False
-            partial_matches = [choice for choice in choices if choice.startswith(arg)]
+            partial_matches = [
+                choice for choice in bucket if len(choice) >= arg_length and choice.startswith(arg)
+            ]
             matches_str = ", ".join(partial_matches)
-            error_message = (
-                f"The argument '{arg}' matches multiple choices: {matches_str}. Be more specific."
+            error_message = "".join(  # noqa: FLY002
+                (
+                    "The argument '",
+                    arg,
+                    "' matches multiple choices: ",
+                    matches_str,
+                    ". Be more specific.",
+                )
             )
             raise ValueError(error_message)
     else:
@@ -114,17 +299,18 @@ def _(arg: str, choices: list[str], *, several_ok: bool = False) -> str | list[s
         return matched_choice
 
 
-@_match_arg.register(Iterable)
-def _(arg: Iterable[str], choices: list[str], *, several_ok: bool = False) -> str | list[str]:
+def _match_iterable(
+    arg: Iterable[str], choices: Sequence[str], *, several_ok: bool = False
+) -> list[str]:
     """Internal implementation for iterable argument matching.
 
-    Note: While str is technically an Iterable, singledispatch will dispatch
-    strings to the str handler (line 63) because it's more specific.
-    This handler only receives non-str iterables like list, tuple, set, etc.
+    Note: Strings are routed to _match_one by the isinstance checks in
+    match_arg, match_arg_one, and match_arg_many, so this handler only
+    receives non-str iterables like list, tuple, set, etc.
 
     Args:
         arg: Iterable of argument strings to be matched against choices.
-        choices: List of valid choices to match against. Duplicates are removed.
+        choices: Valid choices to match against. Duplicates are removed.
         several_ok: If True, allows multiple matches and always returns list.
                    If False, raises error for iterable input.
 
@@ -135,37 +321,29 @@ def _(arg: Iterable[str], choices: list[str], *, several_ok: bool = False) -> st
         ValueError: If several_ok=False (iterable input not allowed), or if any element
                    in the iterable cannot be matched.
     """
-    # Ensure choices are unique
-    choices = list(dict.fromkeys(choices))
+    # Ensure choices are unique (cached per choices tuple)
+    prepared = _prepare_choices(tuple(choices))
 
     # Handle iterable input
     if not several_ok:
-        error_message = (
-            "Iterable input is only allowed when several_ok=True. "
-            "Use several_ok=True or provide a single string argument."
-        )
-        raise ValueError(error_message)
+        raise ValueError(_ITERABLE_INPUT_ERROR)
 
-    # Convert iterable to list to handle one-time iterables like generators
-    arg_list = list(arg)
-
-    # Process each element in the iterable
+    # Process each element against the shared deduplicated choices
     all_matches = []
-    for i, single_arg in enumerate(arg_list):
+    for i, single_arg in enumerate(arg):
         try:
-            # Recursively call match_arg for each element
-            result = _match_arg(single_arg, choices, several_ok=True)
             # result is always a list when several_ok=True
-            all_matches.extend(result)
+            all_matches.extend(_match_one(single_arg, prepared, several_ok=True))
         except ValueError as e:
             # Re-raise with information about which element failed
-            error_message = f"Error in iterable element {i} ('{single_arg}'): {e}"
+            error_message = "".join(
+                ("Error in iterable element ", str(i), " ('", str(single_arg), "'): ", str(e))
+            )
             raise ValueError(error_message) from e
 
     return all_matches
 
 
-@validate_call
 def pmatch(x: str, table: Iterable[str]) -> int | None:
     """Partial matching function similar to R's charmatch/pmatch.
 
@@ -184,24 +362,37 @@ def pmatch(x: str, table: Iterable[str]) -> int | None:
 
     Returns:
         Index of match if found and unique, -1 if ambiguous, None if no match
+
+    Raises:
+        TypeError: If x is not a string.
     """
+    if not isinstance(x, str):
+        msg = f"x must be a string, got {type(x).__name__}."
+        raise TypeError(msg)
     if not x:  # Empty string matches nothing
         return None
 
-    table_list = list(table)
-
-    # First check for exact match
-    try:
-        return table_list.index(x)
-    except ValueError:
-        pass
-
-    # Check for prefix matches
-    matches = [i for i, choice in enumerate(table_list) if choice.startswith(x)]
-
-    if not matches:
-        return None
-    elif len(matches) == 1:
-        return matches[0]
-    else:
-        return -1  # Ambiguous
+    # Internal callers already pass a tuple; only materialize other iterables
+    table_tuple = table if isinstance(table, tuple) else tuple(table)
+
+    # Exact match (preferred over prefix matches) is a single hash lookup
+    exact = _exact_index(table_tuple).get(x)
+    if exact is not None:
+        return exact
+
+    # Large tables get a cached prefix trie, resolving the lookup in
+    # O(len(x)) regardless of table size
+    trie = _prefix_trie(table_tuple)
+    if trie is not None:
+        return _trie_lookup(trie, x)
+
+    # Sorting makes prefix matches contiguous, so a unique or ambiguous
+    # prefix can be located with a binary search.
+    keys, indices = _sorted_index(table_tuple)
+
+    position = bisect_left(keys, x)
+    if position < len(keys) and keys[position].startswith(x):
+        if position + 1 < len(keys) and keys[position + 1].startswith(x):
+            return -1  # Ambiguous
+        return indices[position]
+    return None
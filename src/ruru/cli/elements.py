@@ -4,12 +4,81 @@ Contains functions for headings, alerts, paragraphs, rules, lists, boxes, trees,
 and print helpers.
 """
 
+import signal
+import sys
+from functools import lru_cache
 from os import get_terminal_size
+from types import FrameType
 from typing import Any
 
+from ruru.cli import styles, symbols
 from ruru.cli.styles import blue, bold, green, red, yellow
 from ruru.cli.symbols import bullet, cross, info, line, tick, warning
 
+_terminal_columns_cache: int | None = None
+
+
+def _terminal_columns() -> int:
+    """Return the terminal width, cached to avoid an ioctl per heading."""
+    global _terminal_columns_cache  # noqa: PLW0603
+    if _terminal_columns_cache is None:
+        try:
+            _terminal_columns_cache = get_terminal_size().columns
+        except OSError:
+            _terminal_columns_cache = 80
+    return _terminal_columns_cache
+
+
+def _invalidate_terminal_columns() -> None:
+    """Drop the cached terminal width (and anything derived from it)."""
+    global _terminal_columns_cache  # noqa: PLW0603
+    _terminal_columns_cache = None
+    _repeat_char.cache_clear()
+
+
+# Refresh the cached width when the terminal is resized. Signal handlers can
+# only be installed from the main thread, and SIGWINCH doesn't exist on
+# Windows, so fall back to the one-shot cache silently. Any handler the host
+# application installed first (readline, curses, ...) is chained to rather
+# than replaced.
+if hasattr(signal, "SIGWINCH"):
+    try:
+        _previous_sigwinch = signal.getsignal(signal.SIGWINCH)
+
+        def _handle_sigwinch(signum: int, frame: FrameType | None) -> None:
+            _invalidate_terminal_columns()
+            if callable(_previous_sigwinch):
+                _previous_sigwinch(signum, frame)
+
+        signal.signal(signal.SIGWINCH, _handle_sigwinch)
+    except ValueError:
+        pass
+
+
+_REPEAT_BUFFER_WIDTH = 512
+
+
+@lru_cache(maxsize=8)
+def _repeat_buffer(char: str) -> str:
+    """Return a reusable max-width run of ``char`` to slice from."""
+    return char * _REPEAT_BUFFER_WIDTH
+
+
+@lru_cache(maxsize=128)
+def _repeat_char(char: str, count: int) -> str:
+    """Build (and memoize) a repeated-character string such as h1 dashes.
+
+    Slicing the prebuilt buffer is a bounded copy, cheaper than allocating
+    via multiplication; widths past the buffer fall back to multiplying.
+    """
+    if count <= 0:
+        # A negative slice would wrap around the buffer; multiplication
+        # returned "" here in the unbuffered version
+        return ""
+    if count <= _REPEAT_BUFFER_WIDTH:
+        return _repeat_buffer(char)[:count]
+    return char * count
+
 
 def h1(text: str) -> None:
     """Prints a level 1 heading.
@@ -21,12 +90,8 @@ def h1(text: str) -> None:
         >>> h1("hello")
         ──────────────────────── hello ────────────────────────
     """
-    try:
-        columns = get_terminal_size().columns
-    except OSError:
-        columns = 80
-    line_length = columns
-    dashes = line() * ((line_length - len(text)) // 2 - 1)
+    columns = _terminal_columns()
+    dashes = _repeat_char(line(), (columns - len(text)) // 2 - 1)
     print(f"\n{dashes} {text} {dashes}\n")
 
 
@@ -56,6 +121,29 @@ def h3(text: str) -> None:
     print(f"\n── {text}\n")
 
 
+# Alert prefixes are constant for a given color/symbol mode, so compose the
+# style wrappers once per mode rather than on every call; keying the cache on
+# the live mode keeps them honest after set_ascii_only(),
+# refresh_color_support(), or a swapped stdout changes the detection result
+_PREFIX_CACHE: dict[tuple[bool, bool], tuple[str, str, str, str, str]] = {}
+
+
+def _alert_prefixes() -> tuple[str, str, str, str, str]:
+    """Return the (success, danger, warning, info, note) prefixes for the active mode."""
+    mode = (styles._COLOR_SUPPORTED, symbols._supports_unicode())  # noqa: SLF001
+    prefixes = _PREFIX_CACHE.get(mode)
+    if prefixes is None:
+        prefixes = (
+            f"{bold(green(tick()))} ",
+            f"{bold(red(cross()))} ",
+            f"{bold(yellow(warning()))} ",
+            f"{bold(blue(info()))} ",
+            f"{bold(info())} ",
+        )
+        _PREFIX_CACHE[mode] = prefixes
+    return prefixes
+
+
 def alert_success(message: str) -> None:
     """Prints a success message in green color.
 
@@ -66,7 +154,7 @@ def alert_success(message: str) -> None:
         >>> alert_success("This is a success message.")
         ✔ This is a success message.
     """
-    print(bold(green(tick())), message)
+    sys.stdout.write(f"{_alert_prefixes()[0]}{message}\n")
 
 
 def alert_danger(message: str) -> None:
@@ -79,7 +167,7 @@ def alert_danger(message: str) -> None:
         >>> alert_danger("Danger! Something went wrong.")
         ✖ Danger! Something went wrong.
     """
-    print(bold(red(cross())), message)
+    sys.stdout.write(f"{_alert_prefixes()[1]}{message}\n")
 
 
 def alert_warning(message: str) -> None:
@@ -92,7 +180,7 @@ def alert_warning(message: str) -> None:
         >>> alert_warning("Warning: Proceed with caution.")
         ! Warning: Proceed with caution.
     """
-    print(bold(yellow(warning())), message)
+    sys.stdout.write(f"{_alert_prefixes()[2]}{message}\n")
 
 
 def alert_info(message: str) -> None:
@@ -105,7 +193,7 @@ def alert_info(message: str) -> None:
         >>> alert_info("Information: This is important.")
         ℹ Information: This is important.
     """
-    print(bold(blue(info())), message)
+    sys.stdout.write(f"{_alert_prefixes()[3]}{message}\n")
 
 
 def alert_note(message: str) -> None:
@@ -118,7 +206,7 @@ def alert_note(message: str) -> None:
         >>> alert_note("This is a note.")
         ℹ This is a note.
     """
-    print(bold(info()), message)
+    sys.stdout.write(f"{_alert_prefixes()[4]}{message}\n")
 
 
 def bullets(text: list[Any] | dict[str, Any]) -> None:
@@ -147,13 +235,20 @@ def bullets(text: list[Any] | dict[str, Any]) -> None:
         • age: 30
         • hobbies: reading, coding
     """
+    # Hoist the symbol lookup and emit one write instead of one per item,
+    # so long lists don't pay a syscall per bullet
+    prefix = f"  {bullet()} "
     if isinstance(text, dict):
-        for key, value in text.items():
-            if isinstance(value, list):
-                formatted_value = ", ".join(str(v) for v in value)
-            else:
-                formatted_value = str(value)
-            print(f"  {bullet()}", f"{key}: {formatted_value}")
+        lines = [
+            prefix
+            + f"{key}: "
+            + (", ".join(map(str, value)) if isinstance(value, list) else str(value))
+            for key, value in text.items()
+        ]
     else:
-        for item in text:
-            print(f"  {bullet()}", str(item))
+        # %-formatting reuses the parsed template across items, unlike a
+        # per-item f-string
+        template = prefix + "%s"
+        lines = [template % (item,) for item in text]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -2,8 +2,14 @@
 
 import os
 import sys
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 from typing import Literal
 
+# Bound once so _supports_color skips the module attribute lookup per call
+_getenv = os.getenv
+
 
 # ANSI escape codes for text styling
 class _AnsiCodes:
@@ -39,57 +45,150 @@ class _AnsiCodes:
     BRIGHT_WHITE = "\033[97m"
 
 
-def _supports_color() -> bool:
-    """Check if the terminal supports ANSI color codes."""
+@lru_cache(maxsize=8)
+def _detect_color(
+    no_color: str | None,
+    force_color: str | None,
+    pytest_active: bool,  # noqa: FBT001
+    is_tty: bool,  # noqa: FBT001
+    term: str,
+) -> bool:
+    """Decide color support from an explicit state tuple, memoized per state."""
     # Check if NO_COLOR environment variable is set
-    if os.getenv("NO_COLOR"):
+    if no_color:
         return False
 
     # Check if FORCE_COLOR is set
-    if os.getenv("FORCE_COLOR"):
+    if force_color:
         return True
 
     # For testing environments, always enable colors
-    if "pytest" in sys.modules:
+    if pytest_active:
         return True
 
     # Check if stdout is available and is a TTY
-    if sys.stdout is None or not hasattr(sys.stdout, "isatty") or not sys.stdout.isatty():
+    if not is_tty:
         return False
 
     # Check TERM environment variable
-    term = os.getenv("TERM", "").lower()
-    return "color" in term or term in ("xterm", "xterm-256color", "screen", "linux")
+    term = term.lower()
+    return "color" in term or term in {"xterm", "xterm-256color", "screen", "linux"}
+
+
+def _supports_color() -> bool:
+    """Check if the terminal supports ANSI color codes."""
+    stdout = sys.stdout
+    is_tty = stdout is not None and hasattr(stdout, "isatty") and stdout.isatty()
+    return _detect_color(
+        _getenv("NO_COLOR"),
+        _getenv("FORCE_COLOR"),
+        "pytest" in sys.modules,
+        is_tty,
+        _getenv("TERM", ""),
+    )
+
+
+# Detecting color support costs several getenv calls plus an isatty syscall,
+# so resolve it once at import rather than on every styled token
+_COLOR_SUPPORTED = _supports_color()
+
+
+def refresh_color_support() -> None:
+    """Re-run color detection, e.g. after changing NO_COLOR or redirecting stdout."""
+    global _COLOR_SUPPORTED  # noqa: PLW0603
+    _COLOR_SUPPORTED = _supports_color()
+    clear_style_cache()
 
 
 def _apply_style(text: str, code: str) -> str:
     """Apply ANSI style code to text if color is supported."""
-    if not _supports_color():
+    if not _COLOR_SUPPORTED:
         return text
-    return f"{code}{text}{_AnsiCodes.RESET}"
+    # A single three-part join allocates once; chained + builds intermediates
+    return "".join((code, text, _AnsiCodes.RESET))  # noqa: FLY002
 
 
-# Text style functions
+# Text style functions, memoized because CLIs tend to re-style the same
+# small set of labels over and over
+@lru_cache(maxsize=512)
 def bold(text: str) -> str:
     """Make text bold."""
     return _apply_style(text, _AnsiCodes.BOLD)
 
 
+@lru_cache(maxsize=512)
 def dim(text: str) -> str:
     """Make text dim/faint."""
     return _apply_style(text, _AnsiCodes.DIM)
 
 
+@lru_cache(maxsize=512)
 def italic(text: str) -> str:
     """Make text italic."""
     return _apply_style(text, _AnsiCodes.ITALIC)
 
 
+@lru_cache(maxsize=512)
 def underline(text: str) -> str:
     """Make text underlined."""
     return _apply_style(text, _AnsiCodes.UNDERLINE)
 
 
+def clear_style_cache() -> None:
+    """Drop memoized styled strings, e.g. after color support changes."""
+    for func in (bold, dim, italic, underline, color):
+        func.cache_clear()
+
+
+def styled(text: str, *codes: str) -> str:
+    """Apply several styles to text with a single combined escape sequence.
+
+    Nesting the individual wrappers (e.g. ``bold(red(text))``) emits one
+    escape and one reset per wrapper; this folds the codes into one
+    ``ESC[1;31m``-style sequence with a single reset.
+
+    Args:
+        text: The text to style.
+        *codes: ANSI escape codes to combine, e.g. ``_AnsiCodes.BOLD``.
+
+    Returns:
+        The styled text, or the original text if color is unsupported or no
+        codes were given.
+    """
+    if not _COLOR_SUPPORTED or not codes:
+        return text
+    params = ";".join(code[2:-1] for code in codes)
+    return f"\033[{params}m{text}{_AnsiCodes.RESET}"
+
+
+@dataclass(frozen=True)
+class Style:
+    r"""A composable set of ANSI SGR codes applied with a single escape.
+
+    Styles merge with ``+`` and apply by calling, emitting one combined
+    escape and one reset regardless of how many codes were merged::
+
+        >>> header = Style((1,)) + Style((31,))  # bold + red
+        >>> header("error")
+        '\x1b[1;31merror\x1b[0m'
+    """
+
+    codes: tuple[int, ...]
+
+    def __add__(self, other: "Style") -> "Style":
+        return Style(self.codes + other.codes)
+
+    @cached_property
+    def _prefix(self) -> str:
+        return "\x1b[" + ";".join(map(str, self.codes)) + "m"
+
+    def __call__(self, text: str) -> str:
+        """Apply the merged codes to ``text`` with one escape and one reset."""
+        if not _COLOR_SUPPORTED or not self.codes:
+            return text
+        return "".join((self._prefix, text, _AnsiCodes.RESET))  # noqa: FLY002
+
+
 # Color functions
 ColorName = Literal[
     "black",
@@ -111,9 +210,11 @@ ColorName = Literal[
 ]
 
 
-def color(text: str, color_name: ColorName) -> str:
-    """Apply a color to text."""
-    color_map = {
+# Name-to-code mapping built once rather than per color() call; the read-only
+# proxy keeps the interpreter's dict-load caches stable and guards against
+# accidental mutation
+_COLOR_CODES = MappingProxyType(
+    {
         "black": _AnsiCodes.BLACK,
         "red": _AnsiCodes.RED,
         "green": _AnsiCodes.GREEN,
@@ -131,48 +232,66 @@ def color(text: str, color_name: ColorName) -> str:
         "bright_cyan": _AnsiCodes.BRIGHT_CYAN,
         "bright_white": _AnsiCodes.BRIGHT_WHITE,
     }
+)
+
+# (prefix, suffix) pairs so color() styles with plain concatenation instead
+# of f-string formatting
+# sys.intern keeps the keys identity-comparable with the interned literals
+# callers pass, letting dict probes take the pointer-equality fast path
+_COLOR_WRAPS = MappingProxyType(
+    {sys.intern(name): (code, _AnsiCodes.RESET) for name, code in _COLOR_CODES.items()}
+)
 
-    if color_name not in color_map:
+
+@lru_cache(maxsize=512)
+def color(text: str, color_name: ColorName) -> str:
+    """Apply a color to text."""
+    try:
+        prefix, suffix = _COLOR_WRAPS[color_name]
+    except KeyError:
         msg = f"Unknown color: {color_name}"
-        raise ValueError(msg)
+        raise ValueError(msg) from None
 
-    return _apply_style(text, color_map[color_name])
+    if not _COLOR_SUPPORTED:
+        return text
+    return "".join((prefix, text, suffix))  # noqa: FLY002
 
 
-# Convenience color functions
+# Convenience color functions, reduced to a flag check plus concatenation so
+# each call runs without any helper frame
 def red(text: str) -> str:
     """Make text red."""
-    return color(text, "red")
+    return "".join((_AnsiCodes.RED, text, _AnsiCodes.RESET)) if _COLOR_SUPPORTED else text  # noqa: FLY002
 
 
 def green(text: str) -> str:
     """Make text green."""
-    return color(text, "green")
+    return "".join((_AnsiCodes.GREEN, text, _AnsiCodes.RESET)) if _COLOR_SUPPORTED else text  # noqa: FLY002
 
 
 def yellow(text: str) -> str:
     """Make text yellow."""
-    return color(text, "yellow")
+    return "".join((_AnsiCodes.YELLOW, text, _AnsiCodes.RESET)) if _COLOR_SUPPORTED else text  # noqa: FLY002
 
 
 def blue(text: str) -> str:
     """Make text blue."""
-    return color(text, "blue")
+    return "".join((_AnsiCodes.BLUE, text, _AnsiCodes.RESET)) if _COLOR_SUPPORTED else text  # noqa: FLY002
 
 
 def magenta(text: str) -> str:
     """Make text magenta."""
-    return color(text, "magenta")
+    return "".join((_AnsiCodes.MAGENTA, text, _AnsiCodes.RESET)) if _COLOR_SUPPORTED else text  # noqa: FLY002
 
 
 def cyan(text: str) -> str:
     """Make text cyan."""
-    return color(text, "cyan")
+    return "".join((_AnsiCodes.CYAN, text, _AnsiCodes.RESET)) if _COLOR_SUPPORTED else text  # noqa: FLY002
 
 
 def orange(text: str) -> str:
     """Make text orange (alias for yellow)."""
-    return color(text, "yellow")
+    return "".join((_AnsiCodes.YELLOW, text, _AnsiCodes.RESET)) if _COLOR_SUPPORTED else text  # noqa: FLY002
 
 
 # Backward compatibility alias
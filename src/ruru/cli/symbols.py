@@ -2,23 +2,79 @@
 
 import os
 import sys
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Literal
 
+# When set, overrides ASCII_ONLY/encoding detection entirely, so callers can
+# force a mode once instead of mutating os.environ around every symbol call
+_ASCII_ONLY_OVERRIDE: bool | None = None
+
+
+def set_ascii_only(value: bool | None) -> None:  # noqa: FBT001
+    """Force or clear ASCII-only symbol output.
+
+    Args:
+        value: True to force ASCII symbols, False to force Unicode symbols,
+            None to fall back to environment/encoding detection.
+    """
+    global _ASCII_ONLY_OVERRIDE, _cached_stdout  # noqa: PLW0603
+    _ASCII_ONLY_OVERRIDE = value
+    _cached_stdout = _UNSET
+
+
+@lru_cache(maxsize=8)
+def _detect_unicode(
+    ascii_only_override: bool | None,  # noqa: FBT001
+    ascii_only_env: str | None,
+    encoding: str | None,
+) -> bool:
+    """Decide Unicode support from an explicit state tuple, memoized per state."""
+    if ascii_only_override is not None:
+        return not ascii_only_override
 
-def _supports_unicode() -> bool:
-    """Check if the terminal supports Unicode characters."""
     # Check if ASCII_ONLY environment variable is set
-    if os.getenv("ASCII_ONLY"):
+    if ascii_only_env:
         return False
 
-    # Check encoding - handle None explicitly
-    encoding = getattr(sys.stdout, "encoding", None)
+    # Handle None encoding explicitly
     if encoding is None:
         return False
 
     return encoding.lower() in ("utf-8", "utf8")
 
 
+# The last-seen stdout plus its verdict. Swapping sys.stdout (redirection,
+# test doubles) breaks the identity check and re-triggers detection; holding
+# the object itself (not just its id) stops a recycled address from
+# inheriting a stale verdict. The fast path is skipped whenever an override
+# or ASCII_ONLY is in play. A sentinel marks "nothing cached" because
+# sys.stdout itself can legitimately be None
+_UNSET = object()
+_cached_stdout: object = _UNSET
+_cached_unicode = False
+
+
+def _supports_unicode() -> bool:
+    """Check if the terminal supports Unicode characters."""
+    global _cached_stdout, _cached_unicode  # noqa: PLW0603
+    plain_environment = _ASCII_ONLY_OVERRIDE is None and "ASCII_ONLY" not in os.environ
+    stdout = sys.stdout
+    if plain_environment and stdout is _cached_stdout:
+        return _cached_unicode
+
+    result = _detect_unicode(
+        _ASCII_ONLY_OVERRIDE,
+        os.getenv("ASCII_ONLY"),
+        getattr(stdout, "encoding", None),
+    )
+    if plain_environment:
+        _cached_stdout = stdout
+        _cached_unicode = result
+    return result
+
+
 SymbolName = Literal[
     "tick",
     "cross",
@@ -33,19 +89,33 @@ SymbolName = Literal[
 ]
 
 
-# Symbol definitions with Unicode and ASCII alternatives
-_SYMBOLS = {
-    "tick": {"unicode": "✔", "ascii": "v"},
-    "cross": {"unicode": "✖", "ascii": "x"},
-    "warning": {"unicode": "⚠", "ascii": "!"},
-    "info": {"unicode": "ℹ", "ascii": "i"},
-    "arrow_right": {"unicode": "→", "ascii": "->"},
-    "bullet": {"unicode": "•", "ascii": "*"},
-    "line": {"unicode": "─", "ascii": "-"},
-    "corner": {"unicode": "└", "ascii": "+"},
-    "tree_mid": {"unicode": "├", "ascii": "+"},
-    "tree_end": {"unicode": "└", "ascii": "+"},
-}
+# Symbol definitions with Unicode and ASCII alternatives; read-only so the
+# derived tables can never drift from the source of truth
+_SYMBOLS = MappingProxyType(
+    {
+        "tick": {"unicode": "✔", "ascii": "v"},
+        "cross": {"unicode": "✖", "ascii": "x"},
+        "warning": {"unicode": "⚠", "ascii": "!"},
+        "info": {"unicode": "ℹ", "ascii": "i"},
+        "arrow_right": {"unicode": "→", "ascii": "->"},
+        "bullet": {"unicode": "•", "ascii": "*"},
+        "line": {"unicode": "─", "ascii": "-"},
+        "corner": {"unicode": "└", "ascii": "+"},
+        "tree_mid": {"unicode": "├", "ascii": "+"},
+        "tree_end": {"unicode": "└", "ascii": "+"},
+    }
+)
+
+
+# Flat per-mode tables derived from _SYMBOLS once, so each lookup is a single
+# dict probe instead of a dict-of-dicts double indirection
+_UNICODE_TABLE = MappingProxyType({name: defs["unicode"] for name, defs in _SYMBOLS.items()})
+_ASCII_TABLE = MappingProxyType({name: defs["ascii"] for name, defs in _SYMBOLS.items()})
+
+
+def _active_table() -> Mapping[str, str]:
+    """Return the symbol table for the current Unicode/ASCII mode."""
+    return _UNICODE_TABLE if _supports_unicode() else _ASCII_TABLE
 
 
 def symbol(name: SymbolName) -> str:
@@ -60,63 +130,61 @@ def symbol(name: SymbolName) -> str:
     Raises:
         ValueError: If symbol name is not recognized.
     """
-    if name not in _SYMBOLS:
+    table = _active_table()
+    try:
+        return table[name]
+    except KeyError:
         msg = f"Unknown symbol: {name}"
-        raise ValueError(msg)
-
-    symbol_def = _SYMBOLS[name]
-
-    if _supports_unicode():
-        return symbol_def["unicode"]
-    return symbol_def["ascii"]
+        raise ValueError(msg) from None
 
 
-# Convenience functions for common symbols
+# Convenience functions for common symbols, indexing the active table
+# directly so each call skips the symbol() dispatch frame
 def tick() -> str:
     """Get tick/checkmark symbol."""
-    return symbol("tick")
+    return _active_table()["tick"]
 
 
 def cross() -> str:
     """Get cross/X symbol."""
-    return symbol("cross")
+    return _active_table()["cross"]
 
 
 def warning() -> str:
     """Get warning symbol."""
-    return symbol("warning")
+    return _active_table()["warning"]
 
 
 def info() -> str:
     """Get info symbol."""
-    return symbol("info")
+    return _active_table()["info"]
 
 
 def arrow_right() -> str:
     """Get right arrow symbol."""
-    return symbol("arrow_right")
+    return _active_table()["arrow_right"]
 
 
 def bullet() -> str:
     """Get bullet point symbol."""
-    return symbol("bullet")
+    return _active_table()["bullet"]
 
 
 def line() -> str:
     """Get horizontal line symbol."""
-    return symbol("line")
+    return _active_table()["line"]
 
 
 def corner() -> str:
     """Get corner symbol for boxes/trees."""
-    return symbol("corner")
+    return _active_table()["corner"]
 
 
 def tree_mid() -> str:
     """Get tree middle connector symbol."""
-    return symbol("tree_mid")
+    return _active_table()["tree_mid"]
 
 
 def tree_end() -> str:
     """Get tree end connector symbol."""
-    return symbol("tree_end")
+    return _active_table()["tree_end"]
@@ -5,16 +5,31 @@ Inspired by the R package `config` (https://rstudio.github.io/config/).
 
 import os
 import re
+import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, overload
 
 import yaml
 
+try:  # LibYAML's C loader parses several times faster when available
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _SafeLoader
+
 
 class MissingDefaultConfigError(Exception):
     """Raised when the configuration file does not contain a 'default' key."""
 
 
+# Parsed configs cached per (path, mtime) so repeated get() calls skip the
+# YAML parse while the file is unchanged
+_PARSE_CACHE: dict[tuple[str, int], dict[str, Any]] = {}
+
+# Compiled once; matches $VAR_NAME-style environment variable references
+_ENV_VAR_RE = re.compile(r"\$([A-Z_][A-Z0-9_]*)")
+
+
 def get(
     value: str | None = None,
     config: str | None = None,
@@ -61,8 +76,14 @@ def get(
     if config is None:
         config = os.getenv("CONFIG_ACTIVE", default="default")
 
-    with config_file.open(mode="r", encoding="utf-8") as config_file_handle:
-        config_data: Any = yaml.safe_load(config_file_handle)
+    file_stat = config_file.stat()
+    cache_key = (str(config_file), file_stat.st_mtime_ns)
+    config_data: Any = _PARSE_CACHE.get(cache_key)
+    if config_data is None:
+        with config_file.open(mode="rb") as config_file_handle:
+            config_data = yaml.load(config_file_handle, Loader=_SafeLoader)
+        if isinstance(config_data, dict):
+            _PARSE_CACHE[cache_key] = config_data
 
     if not isinstance(config_data, dict):
         msg = f"Configuration file '{config_file}' must contain a dictionary."
@@ -80,7 +101,9 @@ def get(
         raise TypeError(msg)
 
     if isinstance(default_config, dict) and default_config:
-        merged_config = {**default_config, **environment_config}
+        # copy()+update() rehashes each key once, unlike the {**a, **b} spread
+        merged_config = default_config.copy()
+        merged_config.update(environment_config)
     elif isinstance(environment_config, dict) and environment_config:
         merged_config = environment_config
     else:
@@ -97,12 +120,39 @@ def get(
     return merged_config.get(value)
 
 
+@lru_cache(maxsize=32)
+def _find_config_file_cached(cwd: str, file: str, use_parent: bool) -> Path:  # noqa: FBT001
+    """Resolve a config file starting from ``cwd``, memoized per arguments.
+
+    Failed searches raise and are therefore never cached.
+    """
+    current_path: Path | None = Path(cwd)
+
+    while current_path is not None:
+        config_file = current_path / file
+        # One stat per level; exists() + is_file() would issue two
+        try:
+            if stat.S_ISREG(config_file.stat().st_mode):
+                return config_file
+        except OSError:
+            pass
+
+        if not use_parent:
+            break
+
+        current_path = current_path.parent if current_path.parent != current_path else None
+
+    msg = f"Configuration file '{file}' not found."
+    raise FileNotFoundError(msg)
+
+
 def find_config_file(file: str | Path, *, use_parent: bool) -> Path:
     """Find the specified configuration file in the current or parent directories.
 
     This function searches for the specified configuration file in the current
     directory and, if not found, optionally continues searching in parent
-    directories.
+    directories. Successful lookups are memoized per working directory; call
+    ``find_config_file.cache_clear()`` if files are created or removed mid-run.
 
     Args:
         file: Name of the configuration file to search for.
@@ -112,20 +162,10 @@ def find_config_file(file: str | Path, *, use_parent: bool) -> Path:
     Returns:
         The absolute path of the found configuration file.
     """
-    current_path = Path().cwd()
+    return _find_config_file_cached(str(Path.cwd()), str(file), use_parent)
 
-    while current_path is not None:
-        config_file = current_path / file
-        if config_file.exists() and config_file.is_file():
-            return config_file
 
-        if not use_parent:
-            break
-
-        current_path = current_path.parent if current_path.parent != current_path else None
-
-    msg = f"Configuration file '{file}' not found."
-    raise FileNotFoundError(msg)
+find_config_file.cache_clear = _find_config_file_cached.cache_clear  # type: ignore[attr-defined]
 
 
 @overload
@@ -167,11 +207,19 @@ def _replace_item(item: dict) -> dict: ...
 @overload
 def _replace_item(item: list) -> list: ...
 def _replace_item(item: str | dict | list) -> str | dict | list:
-    """Helper function to replace an individual item."""
-    if isinstance(item, str) and "$" in item:
+    """Helper function to replace an individual item.
+
+    YAML produces exact built-in types, so identity checks on ``type`` are
+    used here instead of isinstance dispatch on this per-leaf hot path.
+    """
+    if type(item) is str:
+        if "$" not in item:
+            return item
         return _expand_env_vars(item)
-    if isinstance(item, dict | list):
-        return replace_env_vars(item)
+    if type(item) is dict:
+        return {key: _replace_item(val) for key, val in item.items()}
+    if type(item) is list:
+        return [_replace_item(val) for val in item]
     return item
 
 
@@ -212,13 +260,11 @@ def _expand_env_vars(value: str) -> str:
         >>> _expand_env_vars("$VAR1-$VAR2")
         'value1-value2'
     """
-    pattern = r"\$([A-Z_][A-Z0-9_]*)"
-
     # Check if it's a pure env var for backward compatibility
-    match = re.fullmatch(pattern, value)
+    match = _ENV_VAR_RE.fullmatch(value)
     if match:
         var_name = match.group(1)
         return os.getenv(var_name, default=value)
 
     # Handle mixed strings
-    return re.sub(pattern, _replace_var, value)
+    return _ENV_VAR_RE.sub(_replace_var, value)
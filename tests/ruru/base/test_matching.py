@@ -1,35 +1,55 @@
 """Tests for the matching module functions."""
 
+import re
+from collections import Counter
+
 import pytest
 
-from ruru.base.matching import match_arg, pmatch
+from ruru.base.matching import match_arg, match_arg_many, match_arg_one, pmatch
+
+# Compiled once so parametrized pytest.raises calls don't recompile the
+# pattern for every case
+NOT_VALID_PATTERN = re.compile("not valid")
+IS_NOT_VALID_PATTERN = re.compile("is not valid")
+MULTIPLE_CHOICES_PATTERN = re.compile("matches multiple choices")
+ITERABLE_NOT_ALLOWED_PATTERN = re.compile("Iterable input is only allowed when several_ok=True")
+ITERABLE_ELEMENT_PATTERN = re.compile(r"Error in iterable element 1 \('xyz'\).*not valid")
 
+# Shared immutable choice sets, hoisted so parametrize cases don't rebuild
+# equal lists at collection time
+APPLE_APRICOT_BANANA = ("apple", "apricot", "banana")
+ZEBRA_APPLE_APRICOT_ANT = ("zebra", "apple", "apricot", "ant")
+STANDARD = ("apple", "banana", "cherry")
+NUMBERED_APPLES = ("apple1", "apple2", "banana")
+MIXED_CASE_APPLES = ("Apple", "apple", "APPLE")
+BERRY_CHOICES = ("apple", "apricot", "banana", "blueberry")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def standard_choices():
     """Standard test choices fixture."""
-    return ["apple", "banana", "cherry"]
+    return ("apple", "banana", "cherry")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def partial_match_choices():
     """Choices for partial matching tests."""
-    return ["apple", "apricot", "banana"]
+    return ("apple", "apricot", "banana")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ambiguous_choices():
     """Choices that create ambiguous matches."""
-    return ["mean", "median", "mode"]
+    return ("mean", "median", "mode")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def integration_test_data():
     """Data for integration tests."""
     return {
-        "exact_precedence": ["test", "testing", "tester"],
-        "duplicate_exact": ["test", "other", "test"],
-        "complex_partial": ["configure", "config", "confirm", "console"],
+        "exact_precedence": ("test", "testing", "tester"),
+        "duplicate_exact": ("test", "other", "test"),
+        "complex_partial": ("configure", "config", "confirm", "console"),
     }
 
 
@@ -94,20 +114,20 @@ class TestMatchArgAmbiguousMatches:
 
     def test_ambiguous_match_error(self, partial_match_choices):
         """Test that ambiguous partial match raises error when several_ok=False."""
-        with pytest.raises(ValueError, match="matches multiple choices"):
+        with pytest.raises(ValueError, match=MULTIPLE_CHOICES_PATTERN):
             match_arg("ap", partial_match_choices)
 
     @pytest.mark.parametrize(
         ("query", "choices", "expected"),
         [
-            ("ap", ["apple", "apricot", "banana"], ["apple", "apricot"]),
-            ("a", ["zebra", "apple", "apricot", "ant"], ["apple", "apricot", "ant"]),
+            ("ap", APPLE_APRICOT_BANANA, ["apple", "apricot"]),
+            ("a", ZEBRA_APPLE_APRICOT_ANT, ["apple", "apricot", "ant"]),
         ],
     )
     def test_ambiguous_match_several_ok_true(self, query, choices, expected):
         """Test ambiguous matches allowed when several_ok=True."""
         result = match_arg(query, choices, several_ok=True)
-        assert sorted(result) == sorted(expected)
+        assert Counter(result) == Counter(expected)
 
 
 class TestMatchArgNoMatches:
@@ -116,8 +136,8 @@ class TestMatchArgNoMatches:
     @pytest.mark.parametrize(
         ("query", "error_pattern"),
         [
-            ("orange", "not valid"),
-            ("xyz", "is not valid"),
+            ("orange", NOT_VALID_PATTERN),
+            ("xyz", IS_NOT_VALID_PATTERN),
         ],
     )
     def test_no_match_raises_error(self, standard_choices, query, error_pattern):
@@ -132,8 +152,8 @@ class TestMatchArgEdgeCases:
     @pytest.mark.parametrize(
         ("query", "choices", "error_pattern"),
         [
-            ("", ["apple", "banana", "cherry"], "not valid"),
-            ("app", ["apple1", "apple2", "banana"], "matches multiple choices"),
+            ("", STANDARD, NOT_VALID_PATTERN),
+            ("app", NUMBERED_APPLES, MULTIPLE_CHOICES_PATTERN),
         ],
     )
     def test_error_conditions(self, query, choices, error_pattern):
@@ -143,8 +163,7 @@ class TestMatchArgEdgeCases:
 
     def test_case_sensitivity(self):
         """Test that matching is case-sensitive."""
-        choices = ["Apple", "apple", "APPLE"]
-        result = match_arg("app", choices)
+        result = match_arg("app", MIXED_CASE_APPLES)
         assert result == "apple"
 
 
@@ -154,32 +173,29 @@ class TestMatchArgListInput:
     def test_match_arg_list_input_several_ok_true(self, standard_choices):
         """Test list input with several_ok=True returns correct list."""
         result = match_arg(["ban", "app"], standard_choices, several_ok=True)
-        assert sorted(result) == sorted(["banana", "apple"])
+        assert Counter(result) == Counter(["banana", "apple"])
 
     def test_match_arg_list_input_several_ok_false(self, standard_choices):
         """Test list input with several_ok=False raises error."""
-        error_msg = "Iterable input is only allowed when several_ok=True"
-        with pytest.raises(ValueError, match=error_msg):
+        with pytest.raises(ValueError, match=ITERABLE_NOT_ALLOWED_PATTERN):
             match_arg(["ban", "app"], standard_choices, several_ok=False)
 
     def test_match_arg_list_with_ambiguous_element(self, partial_match_choices):
         """Test list with ambiguous element returns all matches when several_ok=True."""
         # "ap" is ambiguous (matches both "apple" and "apricot")
         result = match_arg(["ban", "ap"], partial_match_choices, several_ok=True)
-        assert sorted(result) == sorted(["banana", "apple", "apricot"])
+        assert Counter(result) == Counter(["banana", "apple", "apricot"])
 
     def test_match_arg_list_with_no_match_element(self, standard_choices):
         """Test list with no-match element raises error with clear message."""
-        error_msg = "Error in iterable element 1 \\('xyz'\\).*not valid"
-        with pytest.raises(ValueError, match=error_msg):
+        with pytest.raises(ValueError, match=ITERABLE_ELEMENT_PATTERN):
             match_arg(["ban", "xyz"], standard_choices, several_ok=True)
 
     def test_match_arg_list_mixed_matches(self):
         """Test list with exact, partial, and multiple matches."""
-        choices = ["apple", "apricot", "banana", "blueberry"]
         # "apple" (exact), "ban" (partial), "a" (multiple partial)
-        result = match_arg(["apple", "ban", "a"], choices, several_ok=True)
-        assert sorted(result) == sorted(["apple", "banana", "apple", "apricot"])
+        result = match_arg(["apple", "ban", "a"], BERRY_CHOICES, several_ok=True)
+        assert Counter(result) == Counter(["apple", "banana", "apple", "apricot"])
 
     def test_match_arg_empty_list(self, standard_choices):
         """Test empty list input returns empty list."""
@@ -189,7 +205,7 @@ class TestMatchArgListInput:
     def test_match_arg_list_with_duplicates(self, standard_choices):
         """Test list input with duplicate arguments."""
         result = match_arg(["ban", "ban", "app"], standard_choices, several_ok=True)
-        assert sorted(result) == sorted(["banana", "banana", "apple"])
+        assert Counter(result) == Counter(["banana", "banana", "apple"])
 
     def test_match_arg_exact_duplicate_case(self, standard_choices):
         """Test the specific duplicate case requested in comment."""
@@ -207,7 +223,7 @@ class TestMatchArgListInput:
     def test_match_arg_list_various_scenarios(self, standard_choices, query_list, expected):
         """Test various list input scenarios."""
         result = match_arg(query_list, standard_choices, several_ok=True)
-        assert sorted(result) == sorted(expected)
+        assert Counter(result) == Counter(expected)
 
 
 class TestMatchArgIterableTypes:
@@ -216,23 +232,22 @@ class TestMatchArgIterableTypes:
     def test_match_arg_tuple_input(self, standard_choices):
         """Test tuple input works with several_ok=True."""
         result = match_arg(("ban", "app"), standard_choices, several_ok=True)
-        assert sorted(result) == sorted(["banana", "apple"])
+        assert Counter(result) == Counter(["banana", "apple"])
 
     def test_match_arg_set_input(self, standard_choices):
         """Test set input works with several_ok=True."""
         result = match_arg({"ban", "app"}, standard_choices, several_ok=True)
-        assert sorted(result) == sorted(["banana", "apple"])
+        assert Counter(result) == Counter(["banana", "apple"])
 
     def test_match_arg_generator_input(self, standard_choices):
         """Test generator input works with several_ok=True."""
         generator = (x for x in ["ban", "app"])
         result = match_arg(generator, standard_choices, several_ok=True)
-        assert sorted(result) == sorted(["banana", "apple"])
+        assert Counter(result) == Counter(["banana", "apple"])
 
     def test_match_arg_tuple_input_several_ok_false(self, standard_choices):
         """Test tuple input with several_ok=False raises error."""
-        error_msg = "Iterable input is only allowed when several_ok=True"
-        with pytest.raises(ValueError, match=error_msg):
+        with pytest.raises(ValueError, match=ITERABLE_NOT_ALLOWED_PATTERN):
             match_arg(("ban", "app"), standard_choices, several_ok=False)
 
     def test_match_arg_empty_tuple(self, standard_choices):
@@ -255,3 +270,55 @@ class TestMatchArgIterableTypes:
         # With several_ok=True, should still return the matched string in a list
         result = match_arg("ban", standard_choices, several_ok=True)
         assert result == ["banana"]
+
+
+class TestMatchArgOne:
+    """Tests for the match_arg_one specialized entry point."""
+
+    def test_exact_and_partial_match(self, standard_choices):
+        """Test match_arg_one resolves exact and unique partial matches."""
+        assert match_arg_one("banana", list(standard_choices)) == "banana"
+        assert match_arg_one("ch", list(standard_choices)) == "cherry"
+
+    def test_no_match_raises_error(self, standard_choices):
+        """Test match_arg_one raises for an unmatched argument."""
+        with pytest.raises(ValueError, match=IS_NOT_VALID_PATTERN):
+            match_arg_one("xyz", list(standard_choices))
+
+    def test_ambiguous_match_raises_error(self, partial_match_choices):
+        """Test match_arg_one raises for an ambiguous prefix."""
+        with pytest.raises(ValueError, match=MULTIPLE_CHOICES_PATTERN):
+            match_arg_one("ap", list(partial_match_choices))
+
+    def test_iterable_input_raises_error(self, standard_choices):
+        """Test match_arg_one rejects iterable input like several_ok=False."""
+        with pytest.raises(ValueError, match=ITERABLE_NOT_ALLOWED_PATTERN):
+            match_arg_one(["app", "ban"], list(standard_choices))  # type: ignore[arg-type]
+
+    def test_non_iterable_input_raises_type_error(self, standard_choices):
+        """Test match_arg_one raises TypeError for non-string, non-iterable input."""
+        with pytest.raises(TypeError, match="must be a string or an iterable"):
+            match_arg_one(42, list(standard_choices))  # type: ignore[arg-type]
+
+
+class TestMatchArgMany:
+    """Tests for the match_arg_many specialized entry point."""
+
+    def test_string_input_returns_list(self, standard_choices):
+        """Test match_arg_many wraps a single string match in a list."""
+        assert match_arg_many("ban", list(standard_choices)) == ["banana"]
+
+    def test_iterable_input(self, standard_choices):
+        """Test match_arg_many matches every element of an iterable."""
+        result = match_arg_many(["app", "cherry"], list(standard_choices))
+        assert result == ["apple", "cherry"]
+
+    def test_ambiguous_string_returns_all_matches(self, partial_match_choices):
+        """Test match_arg_many returns all partial matches for an ambiguous prefix."""
+        result = match_arg_many("ap", list(partial_match_choices))
+        assert Counter(result) == Counter(["apple", "apricot"])
+
+    def test_unmatched_element_raises_error(self, standard_choices):
+        """Test match_arg_many raises when an iterable element cannot match."""
+        with pytest.raises(ValueError, match=ITERABLE_ELEMENT_PATTERN):
+            match_arg_many(["app", "xyz"], list(standard_choices))
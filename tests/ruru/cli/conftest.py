@@ -0,0 +1,28 @@
+"""Shared fixtures for CLI tests."""
+
+from io import StringIO
+
+import pytest
+
+
+# Custom StringIO class with None encoding for testing
+class StdoutWithNoneEncoding(StringIO):
+    encoding = None  # type: ignore[assignment]
+
+
+_SHARED_STDOUT = StdoutWithNoneEncoding()
+
+
+@pytest.fixture
+def none_encoding_stdout():
+    """Provide a reusable stdout double whose encoding is None.
+
+    One buffer is shared across tests and reset between them, so each test
+    skips a fresh StringIO allocation. Tests install it themselves with
+    ``monkeypatch.setattr(sys, "stdout", none_encoding_stdout)`` — pytest's
+    capture machinery reinstates its own stdout between fixture setup and
+    the test call, so patching from a fixture would not stick.
+    """
+    yield _SHARED_STDOUT
+    _SHARED_STDOUT.truncate(0)
+    _SHARED_STDOUT.seek(0)
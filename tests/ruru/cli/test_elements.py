@@ -1,50 +1,64 @@
 import sys
-from io import StringIO
 
 import pytest
 
 from ruru import cli
 
-
-# Custom StringIO class with None encoding for testing
-class StdoutWithNoneEncoding(StringIO):
-    encoding = None  # type: ignore[assignment]
+HEADING_FUNCS = (cli.h1, cli.h2, cli.h3)
+ALERT_CASES = (
+    (cli.alert_success, "Success!"),
+    (cli.alert_danger, "Danger!"),
+    (cli.alert_warning, "Warning!"),
+    (cli.alert_info, "Info!"),
+    (cli.alert_note, "Note!"),
+)
 
 
-@pytest.mark.parametrize("heading_func", [cli.h1, cli.h2, cli.h3])
-def test_heading_functions_produce_output(capfd, heading_func):
+@pytest.mark.parametrize("heading_func", HEADING_FUNCS)
+def test_heading_functions_produce_output(capsys, heading_func):
     """Test heading functions produce output."""
     heading_func("Test Heading")
-    captured = capfd.readouterr()
+    captured = capsys.readouterr()
     assert captured.out != ""
 
 
-@pytest.mark.parametrize(
-    ("alert_func", "msg"),
-    [
-        (cli.alert_success, "Success!"),
-        (cli.alert_danger, "Danger!"),
-        (cli.alert_warning, "Warning!"),
-        (cli.alert_info, "Info!"),
-        (cli.alert_note, "Note!"),
-    ],
-)
-def test_alert_functions_produce_output(capfd, alert_func, msg):
+def test_h1_with_text_wider_than_terminal(capsys):
+    """Test h1 drops the dashes entirely when the text exceeds the terminal width."""
+    text = "X" * 2000
+    cli.h1(text)
+    captured = capsys.readouterr()
+    assert captured.out == f"\n {text} \n\n"
+
+
+@pytest.mark.parametrize(("alert_func", "msg"), ALERT_CASES)
+def test_alert_functions_produce_output(capsys, alert_func, msg):
     """Test alert functions produce output."""
     alert_func(msg)
-    captured = capfd.readouterr()
+    captured = capsys.readouterr()
     assert captured.out != ""
 
 
+def test_alert_prefixes_follow_symbol_mode(capsys):
+    """Test alert prefixes rebuild when set_ascii_only changes the symbol mode."""
+    try:
+        cli.set_ascii_only(True)
+        cli.alert_success("done")
+        captured = capsys.readouterr()
+        assert "v" in captured.out
+        assert "✔" not in captured.out
+    finally:
+        cli.set_ascii_only(None)
+
+
 @pytest.mark.parametrize("items", [["Item 1", "Item 2", "Item 3"]])
-def test_bullets_produce_output(capfd, items):
+def test_bullets_produce_output(capsys, items):
     """Test bullets function produces output."""
     cli.bullets(items)
-    captured = capfd.readouterr()
+    captured = capsys.readouterr()
     assert captured.out != ""
 
 
-def test_bullets_with_dict(capfd):
+def test_bullets_with_dict(capsys):
     """Test bullets function with dict input."""
     input_dict = {
         "summary": "User requests a working example for D3.js tree components.",
@@ -52,7 +66,7 @@ def test_bullets_with_dict(capfd):
         "tags": ["HTML", "D3.js", "JavaScript", "Tree Component", "Data Visualization"],
     }
     cli.bullets(input_dict)
-    captured = capfd.readouterr()
+    captured = capsys.readouterr()
     expected_output = (
         "  • summary: User requests a working example for D3.js tree components.\n"
         "  • category: Code Request\n"
@@ -61,34 +75,32 @@ def test_bullets_with_dict(capfd):
     assert captured.out == expected_output
 
 
-def test_bullets_with_mixed_types(capfd):
+def test_bullets_with_mixed_types(capsys):
     """Test bullets function with mixed types in list."""
     mixed_list = ["Text item", 42, 3.14, True]
     cli.bullets(mixed_list)
-    captured = capfd.readouterr()
+    captured = capsys.readouterr()
     expected_output = "  • Text item\n  • 42\n  • 3.14\n  • True\n"
     assert captured.out == expected_output
 
 
-def test_bullets_with_none_stdout_encoding(monkeypatch):
+def test_bullets_with_none_stdout_encoding(monkeypatch, none_encoding_stdout):
     """Test bullets handles None stdout.encoding gracefully."""
-    mock_stdout = StdoutWithNoneEncoding()
-    monkeypatch.setattr(sys, "stdout", mock_stdout)
+    monkeypatch.setattr(sys, "stdout", none_encoding_stdout)
 
     # Should not crash, should fall back to ASCII
     cli.bullets(["Item 1", "Item 2"])
 
     # Get the output
-    output = mock_stdout.getvalue()
+    output = none_encoding_stdout.getvalue()
     assert "Item 1" in output
     assert "Item 2" in output
     assert "*" in output  # Should use ASCII bullet
 
 
-def test_bullets_with_dict_none_stdout_encoding(monkeypatch):
+def test_bullets_with_dict_none_stdout_encoding(monkeypatch, none_encoding_stdout):
     """Test bullets handles None stdout.encoding with dict input."""
-    mock_stdout = StdoutWithNoneEncoding()
-    monkeypatch.setattr(sys, "stdout", mock_stdout)
+    monkeypatch.setattr(sys, "stdout", none_encoding_stdout)
 
     # Should not crash
     stats = {
@@ -99,6 +111,6 @@ def test_bullets_with_dict_none_stdout_encoding(monkeypatch):
     cli.bullets(stats)
 
     # Get the output
-    output = mock_stdout.getvalue()
+    output = none_encoding_stdout.getvalue()
     assert "elapsed_seconds" in output
     assert "*" in output  # Should use ASCII bullet
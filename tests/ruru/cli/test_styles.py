@@ -1,9 +1,14 @@
 """Tests for the styles module."""
 
+import re
+
 import pytest
 
 from ruru import cli
 
+# Compiled once so pytest.raises doesn't recompile the pattern per run
+UNKNOWN_COLOR_PATTERN = re.compile("Unknown color")
+
 
 @pytest.mark.parametrize("style_func", [cli.bold, cli.dim, cli.italic, cli.underline])
 def test_text_style_functions_return_styled_text(style_func):
@@ -47,3 +52,32 @@ def test_color_function_returns_colored_text(color_name):
     """Test color function returns colored text for valid color names."""
     result = cli.color("test", color_name)
     assert result != "test"
+
+
+def test_color_with_invalid_name_raises_error():
+    """Test color function raises ValueError for unknown color names."""
+    with pytest.raises(ValueError, match=UNKNOWN_COLOR_PATTERN):
+        cli.color("test", "not_a_color")
+
+
+def test_styled_combines_codes_into_single_escape():
+    """Test styled folds several codes into one escape with one reset."""
+    result = cli.styled("test", "\x1b[1m", "\x1b[31m")
+    assert result == "\x1b[1;31mtest\x1b[0m"
+
+
+def test_styled_without_codes_returns_text_unchanged():
+    """Test styled returns the original text when no codes are given."""
+    assert cli.styled("test") == "test"
+
+
+def test_style_applies_merged_codes_with_single_escape():
+    """Test Style merges with + and applies one escape plus one reset."""
+    header = cli.Style((1,)) + cli.Style((31,))
+    assert header.codes == (1, 31)
+    assert header("error") == "\x1b[1;31merror\x1b[0m"
+
+
+def test_style_with_no_codes_returns_text_unchanged():
+    """Test an empty Style leaves text unchanged."""
+    assert cli.Style(())("plain") == "plain"
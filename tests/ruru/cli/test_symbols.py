@@ -1,16 +1,14 @@
 """Tests for the symbols module."""
 
+import re
 import sys
-from io import StringIO
 
 import pytest
 
 from ruru import cli
 
-
-# Custom StringIO class with None encoding for testing
-class StdoutWithNoneEncoding(StringIO):
-    encoding = None  # type: ignore[assignment]
+# Compiled once so pytest.raises doesn't recompile the pattern per run
+UNKNOWN_SYMBOL_PATTERN = re.compile("Unknown symbol")
 
 
 @pytest.mark.parametrize(
@@ -44,10 +42,9 @@ def test_convenience_functions_return_expected_symbols(func, expected_symbols):
         (cli.line, "-"),
     ],
 )
-def test_symbols_with_none_stdout_encoding(monkeypatch, func, expected_ascii):
+def test_symbols_with_none_stdout_encoding(monkeypatch, none_encoding_stdout, func, expected_ascii):
     """Test symbol functions handle None stdout.encoding gracefully."""
-    mock_stdout = StdoutWithNoneEncoding()
-    monkeypatch.setattr(sys, "stdout", mock_stdout)
+    monkeypatch.setattr(sys, "stdout", none_encoding_stdout)
 
     # Should not crash, should fall back to ASCII
     result = func()
@@ -71,3 +68,31 @@ def test_symbols_with_missing_stdout(monkeypatch, func, expected_ascii):
     # Should not crash, should fall back to ASCII
     result = func()
     assert result == expected_ascii
+
+
+def test_symbol_with_invalid_name_raises_error():
+    """Test symbol function raises ValueError for unknown symbol names."""
+    with pytest.raises(ValueError, match=UNKNOWN_SYMBOL_PATTERN):
+        cli.symbol("not_a_symbol")  # type: ignore[arg-type]
+
+
+def test_set_ascii_only_forces_both_modes():
+    """Test set_ascii_only overrides detection in both directions."""
+    try:
+        cli.set_ascii_only(True)
+        assert cli.tick() == "v"
+        cli.set_ascii_only(False)
+        assert cli.tick() == "✔"
+    finally:
+        cli.set_ascii_only(None)
+
+
+def test_set_ascii_only_none_restores_detection(monkeypatch, none_encoding_stdout):
+    """Test clearing the override falls back to encoding detection."""
+    try:
+        cli.set_ascii_only(False)
+        cli.set_ascii_only(None)
+        monkeypatch.setattr(sys, "stdout", none_encoding_stdout)
+        assert cli.tick() == "v"
+    finally:
+        cli.set_ascii_only(None)
@@ -0,0 +1,34 @@
+"""Shared fixtures for config tests."""
+
+from pathlib import Path
+
+import pytest
+
+# Config bodies shared by the get() scenarios; each is written to disk once
+# per session instead of once per test
+CONFIG_VARIANTS = {
+    "standard": "default:\n  key1: value1\n  key2: value2",
+    "overwrite": "default:\n  key1: value1\n  key2: value2\nnon-default:\n  key2: value3",
+    "null_default": "default: ~\nnon-default:\n  key1: value1\n  key2: value2",
+    "missing_default": "environment:\n  key1: value1\n  key2: value2",
+}
+
+
+@pytest.fixture(scope="session")
+def config_variant_files(tmp_path_factory) -> dict[str, Path]:
+    base_dir = tmp_path_factory.mktemp("config_variants")
+    files = {}
+    for name, content in CONFIG_VARIANTS.items():
+        path = base_dir / f"{name}.yml"
+        path.write_text(content)
+        files[name] = path
+    return files
+
+
+@pytest.fixture(scope="session")
+def existing_config_file(tmp_path_factory) -> Path:
+    # Only existence matters for find_config_file, so one sentinel file
+    # shared across the session is enough
+    path = tmp_path_factory.mktemp("find_config") / "config.yml"
+    path.write_text("dummy_content")
+    return path
@@ -1,7 +1,9 @@
-from pathlib import Path
+import contextlib
+import re
 
 import pytest
 
+import ruru.config
 from ruru.config import (
     MissingDefaultConfigError,
     find_config_file,
@@ -9,105 +11,81 @@ from ruru.config import (
     replace_env_vars,
 )
 
-CONFIG_FILE = "config.yml"
-
-
-@pytest.fixture
-def config_fixture_path(tmp_path: Path) -> Path:
-    temp_config_path = tmp_path / CONFIG_FILE
-    return temp_config_path
+MIXED_STRING_CASES = (
+    ("https://$APP_NAME", {"APP_NAME": "myapp"}, "https://myapp"),
+    (
+        "$APP_NAME.azurecontainer.io",
+        {"APP_NAME": "myapp"},
+        "myapp.azurecontainer.io",
+    ),
+    ("$VAR1$VAR2", {"VAR1": "hello", "VAR2": "world"}, "helloworld"),
+    ("$VAR1-$VAR2", {"VAR1": "app", "VAR2": "env"}, "app-env"),
+    (
+        "https://$APP_NAME.$DOMAIN",
+        {"APP_NAME": "myapp", "DOMAIN": "eastus.azurecontainer.io"},
+        "https://myapp.eastus.azurecontainer.io",
+    ),
+    ("$SINGLE_VAR", {"SINGLE_VAR": "value"}, "value"),
+    ("https://$MISSING_VAR.com", {}, "https://.com"),
+    ("https://static.com", {}, "https://static.com"),
+)
 
 
 class TestGet:
     @pytest.mark.parametrize(
-        ("config_content", "key", "config_name", "env_var", "expected"),
+        ("variant", "key", "config_name", "env_var", "expected", "raises"),
         [
             # Existing value with CONFIG_ACTIVE set
-            (
-                "default:\n  key1: value1\n  key2: value2",
-                "key1",
-                None,
-                "default",
-                "value1",
-            ),
+            ("standard", "key1", None, "default", "value1", None),
             # Non-existing value
-            (
-                "default:\n  key1: value1\n  key2: value2",
-                "non_existing_key",
-                None,
-                None,
-                None,
-            ),
+            ("standard", "non_existing_key", None, None, None, None),
             # Overwriting value with explicit config
-            (
-                "default:\n  key1: value1\n  key2: value2\nnon-default:\n  key2: value3",
-                "key2",
-                "non-default",
-                None,
-                "value3",
-            ),
+            ("overwrite", "key2", "non-default", None, "value3", None),
             # Null default config
-            (
-                "default: ~\nnon-default:\n  key1: value1\n  key2: value2",
-                "key1",
-                None,
-                "non-default",
-                "value1",
-            ),
+            ("null_default", "key1", None, "non-default", "value1", None),
+            # No default config at all
+            ("missing_default", None, None, None, None, MissingDefaultConfigError),
         ],
         ids=[
             "existing_value",
             "non_existing_value",
             "overwriting_value",
             "null_default",
+            "missing_default_key",
         ],
     )
     def test_get_scenarios(
         self,
-        config_fixture_path,
-        config_content,
+        config_variant_files,
+        variant,
         key,
         config_name,
         env_var,
         expected,
+        raises,
         monkeypatch,
     ):
         if env_var:
             monkeypatch.setenv("CONFIG_ACTIVE", env_var)
-        config_fixture_path.write_text(config_content)
-        result = get(key, file=config_fixture_path, config=config_name)
-        assert result == expected
-
-    def test_missing_default_key(self, config_fixture_path: Path):
-        config_fixture_path.write_text("""
-        environment:
-            key1: value1
-            key2: value2
-        """)
-        with pytest.raises(MissingDefaultConfigError):
-            get(file=config_fixture_path)
+        context = pytest.raises(raises) if raises else contextlib.nullcontext()
+        with context:
+            result = get(key, file=config_variant_files[variant], config=config_name)
+            assert result == expected
 
 
 class TestFindConfigFile:
     @pytest.mark.parametrize(
-        ("file_exists", "should_raise"),
-        [
-            (True, False),  # existing file
-            (False, True),  # non-existing file
-        ],
+        "should_raise",
+        [False, True],
         ids=["existing_file", "non_existing_file"],
     )
-    def test_find_config(self, tmp_path, file_exists, should_raise):
-        temp_config_path = tmp_path / CONFIG_FILE
-        if file_exists:
-            temp_config_path.write_text("dummy_content")
-
+    def test_find_config(self, existing_config_file, should_raise):
         if should_raise:
             with pytest.raises(FileNotFoundError):
                 find_config_file("non_existing_file.yml", use_parent=False)
         else:
-            config_path = find_config_file(temp_config_path, use_parent=False)
-            assert config_path == temp_config_path
+            config_path = find_config_file(existing_config_file, use_parent=False)
+            assert config_path == existing_config_file
 
 
 class TestReplaceEnvVars:
@@ -126,27 +104,7 @@ class TestReplaceEnvVars:
         monkeypatch.setenv("TEST_VAR", "replaced_value")
         assert replace_env_vars(input_data) == expected_output
 
-    @pytest.mark.parametrize(
-        ("input_value", "env_vars", "expected"),
-        [
-            ("https://$APP_NAME", {"APP_NAME": "myapp"}, "https://myapp"),
-            (
-                "$APP_NAME.azurecontainer.io",
-                {"APP_NAME": "myapp"},
-                "myapp.azurecontainer.io",
-            ),
-            ("$VAR1$VAR2", {"VAR1": "hello", "VAR2": "world"}, "helloworld"),
-            ("$VAR1-$VAR2", {"VAR1": "app", "VAR2": "env"}, "app-env"),
-            (
-                "https://$APP_NAME.$DOMAIN",
-                {"APP_NAME": "myapp", "DOMAIN": "eastus.azurecontainer.io"},
-                "https://myapp.eastus.azurecontainer.io",
-            ),
-            ("$SINGLE_VAR", {"SINGLE_VAR": "value"}, "value"),
-            ("https://$MISSING_VAR.com", {}, "https://.com"),
-            ("https://static.com", {}, "https://static.com"),
-        ],
-    )
+    @pytest.mark.parametrize(("input_value", "env_vars", "expected"), MIXED_STRING_CASES)
     def test_replace_env_vars_mixed_strings(self, input_value, env_vars, expected, monkeypatch):
         for key, value in env_vars.items():
             monkeypatch.setenv(key, value)
@@ -176,3 +134,7 @@ class TestReplaceEnvVars:
     def test_replace_env_vars_backward_compatibility_missing_var(self):
         result = replace_env_vars({"key": "$MISSING_VAR"})
         assert result["key"] == "$MISSING_VAR"
+
+    def test_env_var_pattern_compiled_once(self):
+        # Guard against regressing to a per-call re.compile
+        assert isinstance(ruru.config._ENV_VAR_RE, re.Pattern)  # noqa: SLF001